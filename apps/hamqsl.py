@@ -28,22 +28,30 @@ for solardata in root.findall('solardata'):
     solarwind = solardata.find('solarwind').text
     magneticfield = solardata.find('magneticfield').text
 
-    b8040d = solardata.findall(".//band[@name='80m-40m'][@time='day']")[0].text
-    b3020d = solardata.findall(".//band[@name='30m-20m'][@time='day']")[0].text
-    b1715d = solardata.findall(".//band[@name='17m-15m'][@time='day']")[0].text
-    b1210d = solardata.findall(".//band[@name='12m-10m'][@time='day']")[0].text
-
-    b8040n = solardata.findall(".//band[@name='80m-40m'][@time='night']")[0].text
-    b3020n = solardata.findall(".//band[@name='30m-20m'][@time='night']")[0].text
-    b1715n = solardata.findall(".//band[@name='17m-15m'][@time='night']")[0].text
-    b1210n = solardata.findall(".//band[@name='12m-10m'][@time='night']")[0].text
+    # Walk the band and phenomenon conditions once instead of searching per field
+    conditions = {}
+    for cond in solardata.iter():
+        if cond.tag == 'band':
+            conditions.setdefault((cond.get('name'), cond.get('time')), cond.text)
+        elif cond.tag == 'phenomenon':
+            conditions.setdefault((cond.get('name'), cond.get('location')), cond.text)
+
+    b8040d = conditions[('80m-40m', 'day')]
+    b3020d = conditions[('30m-20m', 'day')]
+    b1715d = conditions[('17m-15m', 'day')]
+    b1210d = conditions[('12m-10m', 'day')]
+
+    b8040n = conditions[('80m-40m', 'night')]
+    b3020n = conditions[('30m-20m', 'night')]
+    b1715n = conditions[('17m-15m', 'night')]
+    b1210n = conditions[('12m-10m', 'night')]
 
     auroralat = solardata.find('latdegree').text
-    esaura = solardata.findall(".//phenomenon[@name='vhf-aurora'][@location='northern_hemi']")[0].text
-    e6meseu = solardata.findall(".//phenomenon[@name='E-Skip'][@location='europe_6m']")[0].text
-    e4meseu = solardata.findall(".//phenomenon[@name='E-Skip'][@location='europe_4m']")[0].text
-    e2meseu = solardata.findall(".//phenomenon[@name='E-Skip'][@location='europe']")[0].text
-    e2mesna = solardata.findall(".//phenomenon[@name='E-Skip'][@location='north_america']")[0].text
+    esaura = conditions[('vhf-aurora', 'northern_hemi')]
+    e6meseu = conditions[('E-Skip', 'europe_6m')]
+    e4meseu = conditions[('E-Skip', 'europe_4m')]
+    e2meseu = conditions[('E-Skip', 'europe')]
+    e2mesna = conditions[('E-Skip', 'north_america')]
 
     geomagfield = solardata.find('geomagfield').text
     snr = solardata.find('signalnoise').text
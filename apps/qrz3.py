@@ -40,6 +40,13 @@ if qrz_user == "":
     quit()
 ###
 
+# Keep one connection to QRZ open for the login and every lookup
+http_session = requests.Session()
+
+# Prompt entries treated as commands rather than call signs
+help_commands = frozenset(("", "?", "h", "help"))
+quit_commands = frozenset(("q", "quit", "x"))
+
 
 class Colors(object):
     if color_term == True:
@@ -84,7 +91,7 @@ def login(username, password):
 
     # Send request
     try:
-        res = requests.get(login_url)
+        res = http_session.get(login_url)
     except requests.exceptions.Timeout:
         _error('Login request to QRZ.com timed out', True)
 
@@ -115,7 +122,7 @@ def lookup_callsign(callsign, session_key):
 
     # Send request
     try:
-        res = requests.get(search_url)
+        res = http_session.get(search_url)
     except requests.exceptions.Timeout:
         _error('Login request to QRZ.com timed out', True)
 
@@ -133,9 +140,7 @@ def lookup_callsign(callsign, session_key):
 
 def display_callsign_info(data):
     # Put data in a dictionary for easy retrieval
-    d = {}
-    for v in data.find_all():
-        d[v.name] = v.text
+    d = {v.name: v.text for v in data.find_all()}
 
     print('--------------------')
 
@@ -210,16 +215,17 @@ def main():
 
     # Lookup Callsigns
     ## Command Line Input
-    if sys.argv:
+    if len(sys.argv) > 1:
         try:lookup_callsign(sys.argv[1], session_key)
         except:pass
 
     ## User Input
     while True:
         callsign = input(Colors.BLUE + '\nCallsign: ' + Colors.END).strip()
-        if "" == callsign or "?" == callsign or "h" == callsign.lower() or "help" == callsign.lower():
+        command = callsign.lower()
+        if command in help_commands:
             print("Enter callsign or enter 'q' to quit")
-        elif "q" == callsign.lower() or "quit" == callsign.lower() or "x" == callsign.lower():
+        elif command in quit_commands:
             exit()
         else:
             lookup_callsign(callsign, session_key)
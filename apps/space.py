@@ -23,14 +23,17 @@ https://services.swpc.noaa.gov/text/.
 Script developed by Brad Brown KC1JMH
 """
 
+# Keep the connection open between reports pulled in one visit
+http_session = requests.Session()
+
 def pullthis(url):
-        response = requests.get(url)
+        response = http_session.get(url)
         data = response.text
         print("\n{}\n".format(data))
 
 print(menu)
 while True:
-        selected = str(input("#1-7), R)elist, A)bout, Q)uit :> "))
+        selected = str(input("#1-7), R)elist, A)bout, Q)uit :> ")).lower()
         if "1" in selected:
                 pullthis("https://services.swpc.noaa.gov/text/wwv.txt") #7
         elif "2" in selected:
@@ -45,10 +48,10 @@ while True:
                 pullthis("https://services.swpc.noaa.gov/text/3-day-geomag-forecast.txt") #3
         elif "7" in selected:
                 pullthis("https://services.swpc.noaa.gov/text/3-day-solar-geomag-predictions.txt") #4
-        elif "a" in selected.lower():
+        elif "a" in selected:
                 print (about)
-        elif "r" in selected.lower():
+        elif "r" in selected:
                 print (menu)
-        elif "q" in selected.lower():
+        elif "q" in selected:
                 print ("\nExiting...\n")
                 exit()
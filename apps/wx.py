@@ -21,14 +21,17 @@ https://www.maine.gov/mema/weather/general-information
 Script developed by Brad Brown KC1JMH
 """
 
+# Keep the connection open between reports pulled in one visit
+http_session = requests.Session()
+
 def pullthis(url):
-        response = requests.get(url)
+        response = http_session.get(url)
         data = response.text
         print("\n{}\n".format(data))
 
 print (menu)
 while True:
-        selected = str(input("#1-5), R)elist, A)bout, Q)uit :> "))
+        selected = str(input("#1-5), R)elist, A)bout, Q)uit :> ")).lower()
         if "1" in selected:
                 pullthis("https://w1.weather.gov/data/GYX/RWSGYX")
         elif "2" in selected:
@@ -39,10 +42,10 @@ while True:
                 pullthis("http://www.weather.gov/data/CAR/SFTCAR")
         elif "5" in selected:
                 pullthis("http://www.weather.gov/data/GYX/RTPGYX")
-        elif "a" in selected.lower():
+        elif "a" in selected:
                 print (about)
-        elif "r" in selected.lower():
+        elif "r" in selected:
                 print (menu)
-        elif "q" in selected.lower():
+        elif "q" in selected:
                 print ("\nExiting...\n")
                 exit()